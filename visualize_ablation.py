@@ -7,35 +7,72 @@
 python visualize_ablation.py experiments/output/ablation_study_xxx/ablation_results.csv
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib
-import numpy as np
+import gc
+import logging
 import sys
-import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# 设置中文字体
-matplotlib.rcParams['font.sans-serif'] = ['SimHei', 'DejaVu Sans', 'Arial Unicode MS']
-matplotlib.rcParams['axes.unicode_minus'] = False
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    import numpy as np
+    import pandas as pd
 
-# 设置论文风格
-plt.style.use('seaborn-v0_8-whitegrid')
-matplotlib.rcParams['figure.dpi'] = 150
-matplotlib.rcParams['savefig.dpi'] = 300
-matplotlib.rcParams['font.size'] = 10
-matplotlib.rcParams['axes.titlesize'] = 12
-matplotlib.rcParams['axes.labelsize'] = 11
+# 进度输出；处理器在 main() 及各绘图进程初始化时配置
+logger = logging.getLogger('visualize_ablation')
 
 # 颜色方案（适合论文）
-COLORS = {
-    'baseline': '#2E86AB',      # 蓝色
-    'ablation1': '#A23B72',     # 紫红色
-    'ablation2': '#F18F01',     # 橙色
-    'ablation3': '#C73E1D',     # 红色
-    'ablation4': '#3B1F2B',     # 深紫色
+# 按位置索引：第一个为baseline，其余依次为各消融配置
+PALETTE = [
+    '#2E86AB',  # 蓝色
+    '#A23B72',  # 紫红色
+    '#F18F01',  # 橙色
+    '#C73E1D',  # 红色
+    '#3B1F2B',  # 深紫色
+]
+
+# 论文风格：在样式表之上叠加的绘图参数
+STYLE_SHEET = 'seaborn-v0_8-whitegrid'
+STYLE = {
+    'font.sans-serif': ['SimHei', 'DejaVu Sans', 'Arial Unicode MS'],  # 中文字体
+    'axes.unicode_minus': False,
+    'figure.dpi': 150,
+    'font.size': 10,
+    'axes.titlesize': 12,
+    'axes.labelsize': 11,
 }
 
+def _setup_logging():
+    """将进度日志输出到stdout（可重复调用，不向根日志器传播）"""
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler(sys.stdout))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+def _import_plotting():
+    """导入 pandas/matplotlib 等重量级依赖
+
+    推迟到参数检查之后执行，缺少参数时无需承担导入开销；
+    同时作为绘图进程的初始化函数。
+    """
+    global pd, np, plt
+    _setup_logging()
+    import pandas as pd
+    import numpy as np
+    import matplotlib
+    matplotlib.use('Agg')  # 仅输出文件，跳过GUI后端探测
+    import matplotlib.pyplot as plt
+    plt.rcParams['figure.max_open_warning'] = 0  # 图表逐个显式关闭
+    
+    # 预先解析中文字体，避免首次绘制时才构建字体缓存
+    from matplotlib import font_manager
+    font_manager.findfont('SimHei', fallback_to_default=True)
+
+# 输出分辨率：综合对比图用于论文终稿，其余图表使用较低分辨率
+DRAFT_DPI = 150
+FINAL_DPI = 300
+
 # 实验类型映射
 EXPERIMENT_TYPES = {
     'CausalFingerprintAblation': '因果指纹验证消融',
@@ -45,54 +82,74 @@ EXPERIMENT_TYPES = {
     'AgentCountAblation': '智能体数量消融',
 }
 
+# 汇总统计所需的列及其类型
+USECOLS = [
+    'ablation_type', 'config_name', 'round_id', 'consensus_reached',
+    'accuracy', 'convergence_time_ms', 'detected_byzantine_count',
+    'consensus_similarity',
+]
+
+DTYPES = {
+    'ablation_type': 'category',
+    'config_name': 'category',
+    'round_id': 'int32',
+    'consensus_reached': 'bool',
+    'accuracy': 'float64',
+    'convergence_time_ms': 'float64',
+    'detected_byzantine_count': 'int32',
+    'consensus_similarity': 'float64',
+}
+
 def load_data(csv_path):
     """加载消融实验数据"""
-    df = pd.read_csv(csv_path)
+    try:
+        # pyarrow引擎多线程解析CSV，列类型仍按DTYPES转换为numpy/category
+        df = pd.read_csv(csv_path, usecols=USECOLS, dtype=DTYPES, engine='pyarrow')
+    except ImportError:
+        # 未安装pyarrow时回退到C解析器
+        df = pd.read_csv(csv_path, usecols=USECOLS, dtype=DTYPES, engine='c')
     return df
 
 def calculate_summary(df):
     """计算每个配置的汇总统计"""
-    summary = df.groupby(['ablation_type', 'config_name']).agg({
-        'round_id': 'count',
-        'consensus_reached': 'mean',
-        'accuracy': 'mean',
-        'convergence_time_ms': 'mean',
-        'detected_byzantine_count': 'mean',
-        'consensus_similarity': 'mean',
-    }).reset_index()
-    
-    summary.columns = ['ablation_type', 'config_name', 'rounds', 
-                       'consensus_rate', 'accuracy', 'time_ms',
-                       'byzantine_detection', 'similarity']
+    summary = df.groupby(['ablation_type', 'config_name'], observed=True).agg(
+        rounds=('round_id', 'count'),
+        consensus_rate=('consensus_reached', 'mean'),
+        accuracy=('accuracy', 'mean'),
+        time_ms=('convergence_time_ms', 'mean'),
+        byzantine_detection=('detected_byzantine_count', 'mean'),
+        similarity=('consensus_similarity', 'mean'),
+    ).reset_index()
     
     return summary
 
-def plot_ablation_comparison(summary, ablation_type, output_dir):
-    """绘制单个消融实验的对比图"""
-    data = summary[summary['ablation_type'] == ablation_type].copy()
-    
-    if data.empty:
-        print(f"警告: 没有找到 {ablation_type} 的数据")
-        return
-    
+def _reorder_baseline_first(data):
+    """将baseline配置排在最前，其余配置按名称排序"""
+    names = set(data['config_name'])
+    if 'baseline' not in names:
+        return data
+    
+    order = ['baseline'] + sorted(names - {'baseline'})
+    config_name = pd.Categorical(data['config_name'], categories=order, ordered=True)
+    return data.assign(config_name=config_name).sort_values('config_name')
+
+def plot_ablation_comparison(data, ablation_type, axes):
+    """在一行三个子图上绘制单个消融实验的对比"""
     # 排序：baseline在前
-    if 'baseline' in data['config_name'].values:
-        baseline_idx = data[data['config_name'] == 'baseline'].index[0]
-        others = data[data['config_name'] != 'baseline']
-        data = pd.concat([data.loc[[baseline_idx]], others])
-    
-    fig, axes = plt.subplots(1, 3, figsize=(14, 4))
+    data = _reorder_baseline_first(data)
     
     # 配置名称
     configs = data['config_name'].tolist()
     x = np.arange(len(configs))
+    colors = PALETTE[:len(configs)]
     
-    # 颜色
-    colors = [COLORS['baseline']] + [COLORS[f'ablation{i}'] for i in range(1, len(configs))]
+    # 三个子图共用的指标数组，一次性转换
+    vals = data[['consensus_rate', 'accuracy', 'byzantine_detection']].to_numpy()
+    consensus, accuracy, byzantine = vals[:, 0] * 100, vals[:, 1] * 100, vals[:, 2]
     
     # 图1: 共识率
     ax1 = axes[0]
-    bars1 = ax1.bar(x, data['consensus_rate'] * 100, color=colors[:len(configs)], edgecolor='black', linewidth=0.5)
+    bars1 = ax1.bar(x, consensus, color=colors, edgecolor='black', linewidth=0.5, rasterized=True)
     ax1.set_ylabel('共识率 (%)')
     ax1.set_xticks(x)
     ax1.set_xticklabels(configs, rotation=45, ha='right')
@@ -100,76 +157,71 @@ def plot_ablation_comparison(summary, ablation_type, output_dir):
     ax1.axhline(y=85, color='gray', linestyle='--', alpha=0.5, label='目标值')
     
     # 添加数值标签
-    for bar, val in zip(bars1, data['consensus_rate'] * 100):
-        ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1, 
-                f'{val:.1f}%', ha='center', va='bottom', fontsize=8)
+    ax1.bar_label(bars1, labels=[f'{v:.1f}%' for v in consensus], padding=2, fontsize=8)
     
     # 图2: 精度
     ax2 = axes[1]
-    bars2 = ax2.bar(x, data['accuracy'] * 100, color=colors[:len(configs)], edgecolor='black', linewidth=0.5)
+    bars2 = ax2.bar(x, accuracy, color=colors, edgecolor='black', linewidth=0.5, rasterized=True)
     ax2.set_ylabel('精度 (%)')
     ax2.set_xticks(x)
     ax2.set_xticklabels(configs, rotation=45, ha='right')
     ax2.set_ylim(0, 100)
     ax2.axhline(y=75, color='gray', linestyle='--', alpha=0.5)
     
-    for bar, val in zip(bars2, data['accuracy'] * 100):
-        ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
-                f'{val:.1f}%', ha='center', va='bottom', fontsize=8)
+    ax2.bar_label(bars2, labels=[f'{v:.1f}%' for v in accuracy], padding=2, fontsize=8)
     
     # 图3: 拜占庭检测率
     ax3 = axes[2]
-    bars3 = ax3.bar(x, data['byzantine_detection'], color=colors[:len(configs)], edgecolor='black', linewidth=0.5)
+    bars3 = ax3.bar(x, byzantine, color=colors, edgecolor='black', linewidth=0.5, rasterized=True)
     ax3.set_ylabel('拜占庭检测数')
     ax3.set_xticks(x)
     ax3.set_xticklabels(configs, rotation=45, ha='right')
     
-    for bar, val in zip(bars3, data['byzantine_detection']):
-        ax3.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.05,
-                f'{val:.2f}', ha='center', va='bottom', fontsize=8)
+    ax3.bar_label(bars3, labels=[f'{v:.2f}' for v in byzantine], padding=2, fontsize=8)
     
     # 标题
     title = EXPERIMENT_TYPES.get(ablation_type, ablation_type)
-    fig.suptitle(title, fontsize=14, fontweight='bold', y=1.02)
+    ax2.set_title(title, fontsize=14, fontweight='bold')
+
+def plot_ablation_comparisons(groups, output_dir):
+    """将所有消融实验的对比图绘制在同一张图中，每种类型一行"""
+    fig, axes = plt.subplots(len(groups), 3, figsize=(14, 4 * len(groups)), squeeze=False)
+    
+    for i, (ablation_type, data) in enumerate(groups.items()):
+        plot_ablation_comparison(data, ablation_type, axes[i])
     
     plt.tight_layout()
     
-    # 保存
-    output_path = os.path.join(output_dir, f'{ablation_type.lower()}.png')
-    plt.savefig(output_path, bbox_inches='tight', facecolor='white')
-    plt.close()
-    print(f"   保存: {output_path}")
+    output_path = output_dir / 'ablation_comparisons.png'
+    plt.savefig(output_path, dpi=DRAFT_DPI, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
+    gc.collect()
+    logger.info('   保存: %s', output_path)
 
-def plot_all_ablations(summary, output_dir):
+def plot_all_ablations(groups, output_dir):
     """绘制所有消融实验的综合对比图"""
     fig, axes = plt.subplots(2, 3, figsize=(15, 10))
     
     # 展平axes数组
     axes = axes.flatten()
     
-    for idx, ablation_type in enumerate(summary['ablation_type'].unique()):
+    for idx, (ablation_type, data) in enumerate(groups.items()):
         if idx >= 6:
             break
-            
-        data = summary[summary['ablation_type'] == ablation_type].copy()
         
         # 排序
-        if 'baseline' in data['config_name'].values:
-            baseline_idx = data[data['config_name'] == 'baseline'].index[0]
-            others = data[data['config_name'] != 'baseline']
-            data = pd.concat([data.loc[[baseline_idx]], others])
+        data = _reorder_baseline_first(data)
         
         ax = axes[idx]
         configs = data['config_name'].tolist()
         x = np.arange(len(configs))
-        colors = [COLORS['baseline']] + [COLORS[f'ablation{i}'] for i in range(1, len(configs))]
         
         # 绘制共识率和精度的对比
         width = 0.35
         ax.bar(x - width/2, data['consensus_rate'] * 100, width, 
-               label='共识率', color=COLORS['baseline'], alpha=0.8)
+               label='共识率', color=PALETTE[0], alpha=0.8, rasterized=True)
         ax.bar(x + width/2, data['accuracy'] * 100, width,
-               label='精度', color=COLORS['ablation1'], alpha=0.8)
+               label='精度', color=PALETTE[1], alpha=0.8, rasterized=True)
         
         ax.set_ylabel('百分比 (%)')
         ax.set_xticks(x)
@@ -181,23 +233,24 @@ def plot_all_ablations(summary, output_dir):
         ax.set_title(title, fontsize=10)
     
     # 隐藏多余的子图
-    for idx in range(len(summary['ablation_type'].unique()), 6):
+    for idx in range(len(groups), 6):
         axes[idx].set_visible(False)
     
     plt.suptitle('消融实验综合对比', fontsize=16, fontweight='bold', y=1.02)
     plt.tight_layout()
     
-    output_path = os.path.join(output_dir, 'all_ablations_comparison.png')
-    plt.savefig(output_path, bbox_inches='tight', facecolor='white')
-    plt.close()
-    print(f"   保存: {output_path}")
+    output_path = output_dir / 'all_ablations_comparison.png'
+    plt.savefig(output_path, dpi=FINAL_DPI, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
+    gc.collect()
+    logger.info('   保存: %s', output_path)
 
-def plot_component_contribution(summary, output_dir):
+def plot_component_contribution(groups, output_dir):
     """绘制组件贡献度热图"""
     # 只看因果指纹消融的结果
-    fingerprint_data = summary[summary['ablation_type'] == 'CausalFingerprintAblation'].copy()
+    fingerprint_data = groups.get('CausalFingerprintAblation')
     
-    if fingerprint_data.empty:
+    if fingerprint_data is None:
         return
     
     fig, ax = plt.subplots(figsize=(10, 6))
@@ -213,9 +266,7 @@ def plot_component_contribution(summary, output_dir):
     if 'baseline' in configs:
         baseline_idx = configs.index('baseline')
         baseline_values = matrix[baseline_idx]
-        relative_drop = np.zeros_like(matrix)
-        for i, row in enumerate(matrix):
-            relative_drop[i] = ((baseline_values - row) / baseline_values) * 100
+        relative_drop = (baseline_values - matrix) / baseline_values * 100
         
         # 热图
         im = ax.imshow(relative_drop.T, cmap='RdYlGn_r', aspect='auto', vmin=0, vmax=50)
@@ -225,53 +276,41 @@ def plot_component_contribution(summary, output_dir):
         ax.set_xticklabels(configs, rotation=45, ha='right')
         ax.set_yticklabels(metric_names)
         
-        # 添加数值标签
-        for i in range(len(metric_names)):
-            for j in range(len(configs)):
-                text = ax.text(j, i, f'{relative_drop[j, i]:.1f}%',
-                             ha='center', va='center', color='black', fontsize=9)
+        # 添加数值标签（一次性格式化所有单元格）
+        labels = np.char.mod('%.1f%%', relative_drop.T)
+        for (i, j), label in np.ndenumerate(labels):
+            ax.text(j, i, label, ha='center', va='center', color='black', fontsize=9)
         
         plt.colorbar(im, ax=ax, label='相对Baseline下降 (%)')
         ax.set_title('移除组件后的性能下降', fontsize=14, fontweight='bold')
     
     plt.tight_layout()
-    output_path = os.path.join(output_dir, 'component_contribution_heatmap.png')
-    plt.savefig(output_path, bbox_inches='tight', facecolor='white')
-    plt.close()
-    print(f"   保存: {output_path}")
+    output_path = output_dir / 'component_contribution_heatmap.png'
+    plt.savefig(output_path, dpi=DRAFT_DPI, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
+    gc.collect()
+    logger.info('   保存: %s', output_path)
 
-def plot_spectral_dimension_impact(summary, output_dir):
+def plot_spectral_dimension_impact(groups, output_dir):
     """绘制谱分析维度影响曲线"""
-    data = summary[summary['ablation_type'] == 'SpectralDimensionAblation'].copy()
+    data = groups.get('SpectralDimensionAblation')
     
-    if data.empty:
+    if data is None:
         return
     
     fig, ax = plt.subplots(figsize=(8, 5))
     
-    # 提取维度
-    dimensions = []
-    for config in data['config_name']:
-        if '0d' in config:
-            dimensions.append(0)
-        elif '2d' in config:
-            dimensions.append(2)
-        elif '4d' in config:
-            dimensions.append(4)
-        elif '8d' in config:
-            dimensions.append(8)
-        else:
-            dimensions.append(0)
-    
-    data['dimensions'] = dimensions
+    # 提取维度（如 8d_spectral -> 8），无法识别时记为0
+    dimensions = data['config_name'].str.extract(r'(\d+)d', expand=False).fillna('0').astype(int)
+    data = data.assign(dimensions=dimensions)
     data = data.sort_values('dimensions')
     
     ax.plot(data['dimensions'], data['consensus_rate'] * 100, 
-            'o-', label='共识率', color=COLORS['baseline'], linewidth=2, markersize=8)
+            'o-', label='共识率', color=PALETTE[0], linewidth=2, markersize=8)
     ax.plot(data['dimensions'], data['accuracy'] * 100,
-            's-', label='精度', color=COLORS['ablation1'], linewidth=2, markersize=8)
+            's-', label='精度', color=PALETTE[1], linewidth=2, markersize=8)
     ax.plot(data['dimensions'], data['byzantine_detection'] * 10,
-            '^-', label='拜占庭检测(×10)', color=COLORS['ablation2'], linewidth=2, markersize=8)
+            '^-', label='拜占庭检测(×10)', color=PALETTE[2], linewidth=2, markersize=8)
     
     ax.set_xlabel('谱特征维度')
     ax.set_ylabel('百分比 (%)')
@@ -282,41 +321,30 @@ def plot_spectral_dimension_impact(summary, output_dir):
     ax.set_title('谱特征维度对系统性能的影响', fontsize=14, fontweight='bold')
     
     plt.tight_layout()
-    output_path = os.path.join(output_dir, 'spectral_dimension_impact.png')
-    plt.savefig(output_path, bbox_inches='tight', facecolor='white')
-    plt.close()
-    print(f"   保存: {output_path}")
+    output_path = output_dir / 'spectral_dimension_impact.png'
+    plt.savefig(output_path, dpi=DRAFT_DPI, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
+    gc.collect()
+    logger.info('   保存: %s', output_path)
 
-def plot_agent_count_impact(summary, output_dir):
+def plot_agent_count_impact(groups, output_dir):
     """绘制智能体数量影响曲线"""
-    data = summary[summary['ablation_type'] == 'AgentCountAblation'].copy()
+    data = groups.get('AgentCountAblation')
     
-    if data.empty:
+    if data is None:
         return
     
     fig, ax = plt.subplots(figsize=(8, 5))
     
-    # 提取智能体数量
-    agent_counts = []
-    for config in data['config_name']:
-        if '5_' in config:
-            agent_counts.append(5)
-        elif '10_' in config:
-            agent_counts.append(10)
-        elif '15_' in config:
-            agent_counts.append(15)
-        elif '20_' in config:
-            agent_counts.append(20)
-        else:
-            agent_counts.append(10)
-    
-    data['agent_count'] = agent_counts
+    # 提取智能体数量（如 15_agents -> 15），无法识别时记为默认的10
+    agent_counts = data['config_name'].str.extract(r'^(\d+)_', expand=False).fillna('10').astype(int)
+    data = data.assign(agent_count=agent_counts)
     data = data.sort_values('agent_count')
     
     ax.plot(data['agent_count'], data['consensus_rate'] * 100,
-            'o-', label='共识率', color=COLORS['baseline'], linewidth=2, markersize=8)
+            'o-', label='共识率', color=PALETTE[0], linewidth=2, markersize=8)
     ax.plot(data['agent_count'], data['accuracy'] * 100,
-            's-', label='精度', color=COLORS['ablation1'], linewidth=2, markersize=8)
+            's-', label='精度', color=PALETTE[1], linewidth=2, markersize=8)
     
     ax.set_xlabel('智能体数量')
     ax.set_ylabel('百分比 (%)')
@@ -327,14 +355,15 @@ def plot_agent_count_impact(summary, output_dir):
     ax.set_title('智能体数量对系统性能的影响', fontsize=14, fontweight='bold')
     
     plt.tight_layout()
-    output_path = os.path.join(output_dir, 'agent_count_impact.png')
-    plt.savefig(output_path, bbox_inches='tight', facecolor='white')
-    plt.close()
-    print(f"   保存: {output_path}")
+    output_path = output_dir / 'agent_count_impact.png'
+    plt.savefig(output_path, dpi=DRAFT_DPI, bbox_inches='tight', facecolor='white')
+    plt.close(fig)
+    gc.collect()
+    logger.info('   保存: %s', output_path)
 
-def generate_latex_table(summary, output_dir):
+def generate_latex_table(groups, output_dir):
     """生成LaTeX格式的对比表格"""
-    latex_content = r"""
+    header = r"""
 \begin{table}[h]
 \centering
 \caption{消融实验结果对比}
@@ -344,35 +373,32 @@ def generate_latex_table(summary, output_dir):
 配置 & 共识率 & 精度 & 拜占庭检测 & 相似度 \\
 \midrule
 """
-    
-    for ablation_type in summary['ablation_type'].unique():
-        data = summary[summary['ablation_type'] == ablation_type]
-        latex_content += f"% {EXPERIMENT_TYPES.get(ablation_type, ablation_type)}\n"
-        
-        for _, row in data.iterrows():
-            config_name = row['config_name'].replace('_', ' ')
-            latex_content += f"{config_name} & {row['consensus_rate']*100:.1f}\\% & "
-            latex_content += f"{row['accuracy']*100:.1f}\\% & "
-            latex_content += f"{row['byzantine_detection']:.2f} & "
-            latex_content += f"{row['similarity']:.3f} \\\\\n"
-        
-        latex_content += "\\midrule\n"
-    
-    latex_content = latex_content.rstrip("\\midrule\n")
-    latex_content += r"""
-\bottomrule
+    footer = r"""\bottomrule
 \end{tabular}
 \end{table}
 """
     
-    output_path = os.path.join(output_dir, 'ablation_table.tex')
+    # 每种消融类型一个分组，分组之间用 \midrule 分隔
+    blocks = []
+    for ablation_type, data in groups.items():
+        rows = [
+            f"{name.replace('_', ' ')} & {cr*100:.1f}\\% & {acc*100:.1f}\\% & {byz:.2f} & {sim:.3f} \\\\\n"
+            for name, cr, acc, byz, sim in zip(
+                data['config_name'], data['consensus_rate'], data['accuracy'],
+                data['byzantine_detection'], data['similarity'])
+        ]
+        blocks.append(f"% {EXPERIMENT_TYPES.get(ablation_type, ablation_type)}\n" + "".join(rows))
+    
+    latex_content = header + "\\midrule\n".join(blocks) + footer
+    
+    output_path = output_dir / 'ablation_table.tex'
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(latex_content)
-    print(f"   保存: {output_path}")
+    logger.info('   保存: %s', output_path)
 
-def generate_markdown_report(summary, df, output_dir):
+def generate_markdown_report(groups, df, output_dir):
     """生成Markdown格式的详细报告"""
-    report = """# 消融实验报告
+    parts = ["""# 消融实验报告
 
 ## 1. 实验概述
 
@@ -387,31 +413,30 @@ def generate_markdown_report(summary, df, output_dir):
 
 ## 2. 实验结果
 
-"""
+"""]
     
-    for ablation_type in summary['ablation_type'].unique():
-        data = summary[summary['ablation_type'] == ablation_type]
+    for idx, (ablation_type, data) in enumerate(groups.items()):
         title = EXPERIMENT_TYPES.get(ablation_type, ablation_type)
         
-        report += f"### 2.{list(summary['ablation_type'].unique()).index(ablation_type) + 1} {title}\n\n"
-        report += "| 配置 | 共识率 | 精度 | 拜占庭检测 | 相似度 | 时间(ms) |\n"
-        report += "|------|--------|------|------------|--------|----------|\n"
-        
-        for _, row in data.iterrows():
-            report += f"| {row['config_name']} | {row['consensus_rate']*100:.1f}% | "
-            report += f"{row['accuracy']*100:.1f}% | {row['byzantine_detection']:.2f} | "
-            report += f"{row['similarity']:.3f} | {row['time_ms']:.0f} |\n"
-        
-        report += "\n"
+        parts.append(f"### 2.{idx + 1} {title}\n\n")
+        parts.append("| 配置 | 共识率 | 精度 | 拜占庭检测 | 相似度 | 时间(ms) |\n")
+        parts.append("|------|--------|------|------------|--------|----------|\n")
+        parts.extend(
+            f"| {name} | {cr*100:.1f}% | {acc*100:.1f}% | {byz:.2f} | {sim:.3f} | {t:.0f} |\n"
+            for name, cr, acc, byz, sim, t in zip(
+                data['config_name'], data['consensus_rate'], data['accuracy'],
+                data['byzantine_detection'], data['similarity'], data['time_ms'])
+        )
+        parts.append("\n")
     
     # 添加关键发现
-    report += """## 3. 关键发现
+    parts.append("""## 3. 关键发现
 
-"""
+""")
     
     # 计算各组件的贡献度
-    fingerprint_data = summary[summary['ablation_type'] == 'CausalFingerprintAblation']
-    if not fingerprint_data.empty:
+    fingerprint_data = groups.get('CausalFingerprintAblation')
+    if fingerprint_data is not None:
         baseline = fingerprint_data[fingerprint_data['config_name'] == 'baseline']
         no_fp = fingerprint_data[fingerprint_data['config_name'] == 'no_fingerprint']
         
@@ -419,7 +444,7 @@ def generate_markdown_report(summary, df, output_dir):
             consensus_drop = (baseline['consensus_rate'].values[0] - no_fp['consensus_rate'].values[0]) * 100
             accuracy_drop = (baseline['accuracy'].values[0] - no_fp['accuracy'].values[0]) * 100
             
-            report += f"""### 3.1 因果指纹验证的贡献
+            parts.append(f"""### 3.1 因果指纹验证的贡献
 
 移除因果指纹验证后：
 - 共识率下降：{consensus_drop:.1f}%
@@ -427,30 +452,26 @@ def generate_markdown_report(summary, df, output_dir):
 
 **结论**：因果指纹验证对共识质量有显著贡献，是系统的重要组件。
 
-"""
+""")
     
     # 谱分析维度影响
-    spectral_data = summary[summary['ablation_type'] == 'SpectralDimensionAblation']
-    if not spectral_data.empty:
-        report += """### 3.2 谱特征维度的影响
+    spectral_data = groups.get('SpectralDimensionAblation')
+    if spectral_data is not None:
+        parts.append("""### 3.2 谱特征维度的影响
 
 | 维度 | 共识率 | 精度 | 说明 |
 |------|--------|------|------|
-"""
-        for _, row in spectral_data.iterrows():
-            dim = row['config_name'].replace('d_spectral', '')
-            report += f"| {dim}维 | {row['consensus_rate']*100:.1f}% | {row['accuracy']*100:.1f}% | "
-            if dim == '8':
-                report += "最佳性能 |\n"
-            elif dim == '0':
-                report += "无谱特征，性能显著下降 |\n"
-            else:
-                report += "中等性能 |\n"
+""")
+        notes = {'8': '最佳性能', '0': '无谱特征，性能显著下降'}
+        for name, cr, acc in zip(spectral_data['config_name'], spectral_data['consensus_rate'],
+                                 spectral_data['accuracy']):
+            dim = name.replace('d_spectral', '')
+            parts.append(f"| {dim}维 | {cr*100:.1f}% | {acc*100:.1f}% | {notes.get(dim, '中等性能')} |\n")
         
-        report += "\n**结论**：8维谱特征能够有效捕获智能体逻辑的复杂性，提供最佳性能。\n\n"
+        parts.append("\n**结论**：8维谱特征能够有效捕获智能体逻辑的复杂性，提供最佳性能。\n\n")
     
     # 总结
-    report += """## 4. 总结
+    parts.append("""## 4. 总结
 
 本次消融实验验证了多智能体预言机系统中各组件的必要性：
 
@@ -463,65 +484,73 @@ def generate_markdown_report(summary, df, output_dir):
 ---
 
 *本报告由消融实验框架自动生成*
-"""
+""")
     
-    output_path = os.path.join(output_dir, 'ablation_detailed_report.md')
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(report)
-    print(f"   保存: {output_path}")
+    output_path = output_dir / 'ablation_detailed_report.md'
+    output_path.write_text("".join(parts), encoding='utf-8')
+    logger.info('   保存: %s', output_path)
+
+def _render(job, groups, output_dir):
+    """在论文风格的局部配置下执行单个绘图任务"""
+    with plt.style.context(STYLE_SHEET), plt.rc_context(STYLE):
+        job(groups, output_dir)
 
 def main():
+    _setup_logging()
     if len(sys.argv) < 2:
-        print("使用方法: python visualize_ablation.py <csv_file_path>")
-        print("示例: python visualize_ablation.py experiments/output/ablation_study_xxx/ablation_results.csv")
+        logger.info("使用方法: python visualize_ablation.py <csv_file_path>")
+        logger.info("示例: python visualize_ablation.py experiments/output/ablation_study_xxx/ablation_results.csv")
         sys.exit(1)
     
+    _import_plotting()
+    
     csv_path = sys.argv[1]
-    output_dir = os.path.dirname(csv_path)
+    output_dir = Path(csv_path).parent
     
-    print(f"\n📊 消融实验可视化")
-    print(f"   输入: {csv_path}")
-    print(f"   输出: {output_dir}\n")
+    logger.info("\n📊 消融实验可视化")
+    logger.info("   输入: %s", csv_path)
+    logger.info("   输出: %s\n", output_dir)
     
     # 加载数据
-    print("1. 加载数据...")
+    logger.info("1. 加载数据...")
     df = load_data(csv_path)
-    print(f"   总记录数: {len(df)}")
+    logger.info("   总记录数: %d", len(df))
     
     # 计算汇总
-    print("\n2. 计算汇总统计...")
+    logger.info("\n2. 计算汇总统计...")
     summary = calculate_summary(df)
-    print(f"   配置数: {len(summary)}")
-    
-    # 生成各类图表
-    print("\n3. 生成图表...")
+    logger.info("   配置数: %d", len(summary))
     
-    # 为每种消融类型生成单独的对比图
-    for ablation_type in summary['ablation_type'].unique():
-        plot_ablation_comparison(summary, ablation_type, output_dir)
+    # 按消融类型一次性分组，避免每个图表重复过滤
+    groups = dict(list(summary.groupby('ablation_type', sort=False, observed=True)))
     
-    # 综合对比图
-    plot_all_ablations(summary, output_dir)
-    
-    # 组件贡献热图
-    plot_component_contribution(summary, output_dir)
-    
-    # 谱维度影响曲线
-    plot_spectral_dimension_impact(summary, output_dir)
-    
-    # 智能体数量影响曲线
-    plot_agent_count_impact(summary, output_dir)
+    # 生成各类图表
+    logger.info("\n3. 生成图表...")
+    
+    plot_jobs = [
+        plot_ablation_comparisons,       # 各消融类型的对比图（合并为一张网格图）
+        plot_all_ablations,              # 综合对比图
+        plot_component_contribution,     # 组件贡献热图
+        plot_spectral_dimension_impact,  # 谱维度影响曲线
+        plot_agent_count_impact,         # 智能体数量影响曲线
+    ]
+    
+    # 各图表相互独立，每个进程渲染一张
+    with ProcessPoolExecutor(initializer=_import_plotting) as executor:
+        futures = [executor.submit(_render, job, groups, output_dir) for job in plot_jobs]
+        for future in futures:
+            future.result()
     
     # 生成LaTeX表格
-    print("\n4. 生成LaTeX表格...")
-    generate_latex_table(summary, output_dir)
+    logger.info("\n4. 生成LaTeX表格...")
+    generate_latex_table(groups, output_dir)
     
     # 生成Markdown报告
-    print("\n5. 生成详细报告...")
-    generate_markdown_report(summary, df, output_dir)
+    logger.info("\n5. 生成详细报告...")
+    generate_markdown_report(groups, df, output_dir)
     
-    print(f"\n✅ 可视化完成！")
-    print(f"   图表保存在: {output_dir}")
+    logger.info("\n✅ 可视化完成！")
+    logger.info("   图表保存在: %s", output_dir)
 
 if __name__ == '__main__':
     main()